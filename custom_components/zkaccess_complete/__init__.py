@@ -10,6 +10,7 @@ from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
 from .coordinator import ZKAccessCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,7 +21,16 @@ PLATFORMS = [
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the ZKAccess integration."""
-    hass.data.setdefault(DOMAIN, {})
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    # Typed registry: only ZKAccessCoordinator instances live in here,
+    # keyed by config entry id. Other domain data (storage, etc.) sits
+    # beside it without polluting coordinator iteration.
+    domain_data.setdefault("coordinators", {})
+
+    # Services are domain-wide, so register them once here rather than
+    # per config entry
+    await async_setup_services(hass)
+
     return True
 
 
@@ -41,8 +51,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     await coordinator.async_config_entry_first_refresh()
     
-    hass.data[DOMAIN][entry.entry_id] = coordinator
-    
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    domain_data.setdefault("coordinators", {})[entry.entry_id] = coordinator
+
+    # Pick up options-flow changes without a restart; the coordinator
+    # caches its options at setup
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
     _LOGGER.info("ZKAccess panel setup complete: %s", entry.data.get("panel_name"))
@@ -50,13 +65,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle an options update."""
+    coordinator = hass.data[DOMAIN]["coordinators"].get(entry.entry_id)
+    if coordinator:
+        coordinator.apply_options(entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN]["coordinators"].pop(entry.entry_id)
         await coordinator.async_disconnect()
     
     return unload_ok
@@ -1,185 +1,551 @@
-"""ZKTeco C3 Access Control Panel Client - Using zkaccess-c3 library."""
+"""ZKTeco C3 Access Control Panel Client - Native asyncio implementation."""
+from __future__ import annotations
+
+import asyncio
 import logging
-import traceback
+import socket
+import struct
+import time
+from functools import lru_cache
 from typing import Any
 
-try:
-    from c3 import C3
-    from c3.controldevice import ControlDeviceOutput
-except ImportError:
-    C3 = None
-    ControlDeviceOutput = None
-
 _LOGGER = logging.getLogger(__name__)
 
+# C3 protocol framing
+START_TOKEN = 0xAA
+END_TOKEN = 0x55
+PROTOCOL_VERSION = 0x01
+
+# Commands
+CMD_CONNECT = 0x76
+CMD_DISCONNECT = 0x02
+CMD_GET_PARAM = 0x04
+CMD_CONTROL = 0x05
+CMD_RTLOG = 0x0B
+
+# Reply codes
+REPLY_OK = 0xC8
+REPLY_ERROR = 0xC9
+
+DEFAULT_TIMEOUT = 10
+
+# Connect retry policy: a short per-attempt timeout keeps an unreachable
+# panel from stalling Home Assistant startup, attempts are spaced with
+# exponential backoff, and after the attempts are exhausted a circuit
+# breaker skips further connects for a cooldown window.
+CONNECT_TIMEOUT = 2
+CONNECT_ATTEMPTS = 3
+CONNECT_BACKOFF = 1.0
+BREAKER_COOLDOWN = 30
+
+# Parameter reads are memoized briefly; panel settings change rarely, so
+# repeated reads inside this window are served from memory.
+PARAM_CACHE_TTL = 30
+
+# Real-time log records are fixed 16-byte structures:
+# time(4) + pin(4) + card(4) + door(1) + event_type(1) + in_out(1) + verify(1)
+RTLOG_RECORD_SIZE = 16
+
+# Pre-compiled structs for the hot packing/unpacking paths
+_HEADER = struct.Struct("<BBH")  # version, command, payload length
+_REPLY_HEADER = struct.Struct("<BBBH")  # start token, version, reply code, length
+_TRAILER = struct.Struct("<HB")  # checksum, end token
+_SESSION = struct.Struct("<HH")  # session id, message number
+_USHORT = struct.Struct("<H")
+_CONTROL = struct.Struct("<BBBBB")  # operation, door, address, duration, reserved
+_RTLOG_RECORD = struct.Struct("<IIIBBBB")
+
+_START = bytes((START_TOKEN,))
+
+
+def _build_crc_table() -> tuple[int, ...]:
+    """Precompute the 256-entry CRC-16/ARC lookup table."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _build_crc_table()
+
+
+@lru_cache(maxsize=8)
+def _parse_model(door_count: int) -> str:
+    """Map a panel's door count to its C3 model name."""
+    return {1: "C3-100", 2: "C3-200", 4: "C3-400"}.get(door_count, "C3-400")
+
 
 class C3Client:
     """Client for communicating with ZKTeco C3 access control panels."""
 
+    # Fallback device info returned whenever the panel is unreachable
+    _OFFLINE_DEVICE_INFO = {
+        "serial_number": "Unknown",
+        "door_count": 4,
+        "model": "C3-400",
+        "firmware": "Unknown",
+    }
+
     def __init__(self, ip: str, port: int = 4370, password: str = ""):
         """Initialize the client."""
         self.ip = ip
         self.port = port
         self.password = password if password else None
-        self.panel = None
         self.connected = False
-        
-        if C3 is None:
-            _LOGGER.error("zkaccess-c3 library not installed")
-
-    def connect(self) -> bool:
-        """Connect to the panel."""
-        if C3 is None:
-            _LOGGER.error("zkaccess-c3 library not available")
-            return False
-        
-        try:
-            self.panel = C3(self.ip, self.port)
-            
-            if self.password:
-                success = self.panel.connect(self.password)
-            else:
-                success = self.panel.connect()
-            
-            if success:
-                self.connected = True
-                _LOGGER.info("Connected to C3 panel at %s:%s", self.ip, self.port)
-                return True
-            else:
-                _LOGGER.error("Failed to connect to panel at %s:%s", self.ip, self.port)
-                return False
-                
-        except Exception as e:
-            _LOGGER.error("Connection error to %s:%s - %s", self.ip, self.port, e)
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._session_id = 0
+        self._message_number = 0
+        self._lock = asyncio.Lock()
+        self._device_info: dict[str, Any] | None = None
+        self._param_requests: dict[tuple[str, ...], asyncio.Task] = {}
+        self._param_cache: dict[tuple[str, ...], tuple[float, dict[str, str]]] = {}
+        self._door_states: dict[int, dict[str, Any]] = {}
+        self._breaker_open_until = 0.0
+
+    async def __aenter__(self) -> C3Client:
+        """Connect on entering an async context."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Always tear the connection down on exit, even on error."""
+        await self.disconnect()
+
+    def _calculate_checksum(self, data: bytes) -> int:
+        """Calculate the CRC-16/ARC checksum over a packet body.
+
+        The panel uses CRC-16/ARC (crcmod's predefined "crc-16", as used
+        by the zkaccess-c3 library this client replaces): reflected poly
+        0xA001 with initial value 0x0000.
+        """
+        crc = 0x0000
+        table = _CRC_TABLE
+        for byte in data:
+            crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        return crc
+
+    def _build_packet(self, command: int, data: bytes = b"") -> bytes:
+        """Build a protocol packet for the given command."""
+        if self._session_id:
+            payload = _SESSION.pack(self._session_id, self._message_number) + data
+        else:
+            payload = data
+
+        body = _HEADER.pack(PROTOCOL_VERSION, command, len(payload)) + payload
+        checksum = self._calculate_checksum(body)
+        return b"".join((_START, body, _TRAILER.pack(checksum, END_TOKEN)))
+
+    async def _read_response(self) -> bytes:
+        """Read one complete reply frame using the declared length header."""
+        # Fixed 5-byte header: start token, version, reply code, 2-byte length
+        header = await asyncio.wait_for(
+            self._reader.readexactly(5), timeout=DEFAULT_TIMEOUT
+        )
+        (length,) = _USHORT.unpack_from(header, 3)
+        # Trailer: 2-byte checksum + end token
+        body = await asyncio.wait_for(
+            self._reader.readexactly(length + 3), timeout=DEFAULT_TIMEOUT
+        )
+        return header + body
+
+    async def _send_command(self, command: int, data: bytes = b"") -> bytes:
+        """Send a command and return the reply payload."""
+        if not self._writer or not self._reader:
+            raise ConnectionError("Not connected to panel")
+
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        async with self._lock:
+            self._message_number += 1
+            message_number = self._message_number
+            packet = self._build_packet(command, data)
+            if debug:
+                _LOGGER.debug("Sending packet: %s", packet.hex())
+
+            self._writer.write(packet)
+            try:
+                await asyncio.wait_for(self._writer.drain(), timeout=DEFAULT_TIMEOUT)
+                response = await self._read_response()
+            except asyncio.CancelledError:
+                # Cancelled between write and read: the reply is still in
+                # flight and would be parsed as the next command's answer.
+                # Drop the connection so no stale bytes survive.
+                await self._close()
+                raise
+            except (asyncio.IncompleteReadError, ConnectionError, OSError):
+                # The persistent connection died mid-exchange; drop it so the
+                # next connect() re-establishes a fresh session.
+                await self._close()
+                raise ConnectionError("Connection to panel lost")
+            if debug:
+                _LOGGER.debug("Received response: %s", response.hex())
+
+        return self._validate_reply(response, message_number)
+
+    def _validate_reply(
+        self, response: bytes, message_number: int | None = None
+    ) -> bytes:
+        """Validate a reply frame and return its payload."""
+        start, _version, reply_code, length = _REPLY_HEADER.unpack_from(response)
+        if start != START_TOKEN:
+            raise ValueError("Invalid response header")
+
+        if response[-1] != END_TOKEN:
+            raise ValueError("Response missing end token")
+
+        # Checksum covers version through payload, same span we sign on send
+        (checksum,) = _USHORT.unpack_from(response, len(response) - 3)
+        if checksum != self._calculate_checksum(response[1:-3]):
+            raise ValueError("Response checksum mismatch")
+
+        if reply_code != REPLY_OK:
+            raise ValueError(f"Panel returned error reply 0x{reply_code:02X}")
+
+        payload = response[5 : 5 + length]
+
+        # Session replies echo the session id and message number first; a
+        # mismatched message number means this is some earlier command's
+        # reply and the stream is out of sync.
+        if self._session_id and len(payload) >= 4:
+            _echoed_session, echoed_number = _SESSION.unpack_from(payload)
+            if message_number is not None and echoed_number != message_number:
+                raise ValueError(
+                    f"Reply message number {echoed_number} does not match "
+                    f"request {message_number}"
+                )
+            payload = payload[4:]
+
+        return bytes(payload)
+
+    async def connect(self) -> bool:
+        """Connect to the panel and open a session, retrying with backoff."""
+        if time.monotonic() < self._breaker_open_until:
+            _LOGGER.debug(
+                "Skipping connect to %s:%s - circuit breaker open",
+                self.ip,
+                self.port,
+            )
             return False
 
-    def disconnect(self) -> None:
+        delay = CONNECT_BACKOFF
+        for attempt in range(1, CONNECT_ATTEMPTS + 1):
+            try:
+                result = await self._connect_once()
+                self._breaker_open_until = 0.0
+                return result
+            except Exception as e:
+                _LOGGER.warning(
+                    "Connection attempt %s/%s to %s:%s failed: %s",
+                    attempt,
+                    CONNECT_ATTEMPTS,
+                    self.ip,
+                    self.port,
+                    e,
+                )
+                await self._close()
+                if attempt < CONNECT_ATTEMPTS:
+                    await asyncio.sleep(delay)
+                    delay *= 2
+
+        self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN
+        _LOGGER.error(
+            "Could not connect to %s:%s - backing off for %ss",
+            self.ip,
+            self.port,
+            BREAKER_COOLDOWN,
+        )
+        return False
+
+    async def _connect_once(self) -> bool:
+        """Perform a single connection and session handshake."""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.ip, self.port),
+            timeout=CONNECT_TIMEOUT,
+        )
+
+        # Door commands are small request/reply packets; disable Nagle so
+        # they are not delayed waiting for a full segment. Keepalive lets
+        # the kernel notice a silently dead panel between polls.
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        self._session_id = 0
+        self._message_number = 0
+
+        data = self.password.encode() if self.password else b""
+        response = await self._send_command(CMD_CONNECT, data)
+
+        if len(response) >= 2:
+            (self._session_id,) = _USHORT.unpack_from(response)
+
+        self.connected = True
+        _LOGGER.info("Connected to C3 panel at %s:%s", self.ip, self.port)
+        return True
+
+    async def _close(self) -> None:
+        """Close the underlying connection."""
+        # Reset the session state before the await so a cancellation during
+        # wait_closed cannot leave a half-torn-down client marked connected
+        writer = self._writer
+        self._reader = None
+        self._writer = None
+        self._session_id = 0
+        self.connected = False
+        self._device_info = None
+        self._param_cache.clear()
+        self._door_states.clear()
+        if writer:
+            try:
+                writer.close()
+                await writer.wait_closed()
+            except OSError:
+                pass  # already dead; nothing left to release
+
+    async def disconnect(self) -> None:
         """Disconnect from the panel."""
-        if self.panel:
+        if self._writer:
             try:
-                self.panel.disconnect()
-                self.connected = False
-                _LOGGER.info("Disconnected from panel %s", self.ip)
+                await self._send_command(CMD_DISCONNECT)
             except Exception as e:
-                _LOGGER.error("Disconnect error: %s", e)
+                _LOGGER.debug("Disconnect command failed: %s", e)
+            await self._close()
+            _LOGGER.info("Disconnected from panel %s", self.ip)
 
-    def get_device_info(self) -> dict[str, Any]:
+    async def get_device_info(self) -> dict[str, Any]:
         """Get device information."""
-        if not self.connected or not self.panel:
-            return {
-                "serial_number": "Unknown",
-                "door_count": 4,
-                "model": "C3-400",
-                "firmware": "Unknown",
-            }
-        
+        if not self.connected:
+            return dict(self._OFFLINE_DEVICE_INFO)
+
+        # Serial number, door count and firmware are static for the life of
+        # a session, so one fetch per connection is enough.
+        if self._device_info is not None:
+            return dict(self._device_info)
+
         try:
-            params = self.panel.get_device_param(["~SerialNumber", "LockCount", "FirmVer"])
-            
-            return {
+            params = await self.get_parameters(
+                ["~SerialNumber", "LockCount", "FirmVer"]
+            )
+
+            door_count = int(params.get("LockCount", "4"))
+            self._device_info = {
                 "serial_number": params.get("~SerialNumber", "Unknown"),
-                "door_count": int(params.get("LockCount", "4")),
+                "door_count": door_count,
                 "firmware": params.get("FirmVer", "Unknown"),
-                "model": "C3-400",
+                "model": _parse_model(door_count),
             }
+            return dict(self._device_info)
         except Exception as e:
             _LOGGER.warning("Could not get device info: %s", e)
-            return {
-                "serial_number": "Unknown",
-                "door_count": 4,
-                "model": "C3-400",
-                "firmware": "Unknown",
-            }
+            return dict(self._OFFLINE_DEVICE_INFO)
 
-    def get_parameters(self, params: list[str]) -> dict[str, str]:
-        """Get device parameters."""
-        if not self.connected or not self.panel:
+    async def get_parameters(self, params: list[str]) -> dict[str, str]:
+        """Get device parameters, coalescing identical in-flight reads."""
+        if not self.connected:
             return {}
-        
+
+        key = tuple(params)
+        cached = self._param_cache.get(key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return dict(cached[1])
+
+        task = self._param_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_parameters(key, params))
+            self._param_requests[key] = task
+            task.add_done_callback(
+                lambda _task, key=key: self._param_requests.pop(key, None)
+            )
+
+        # Copy so concurrent callers cannot mutate each other's result
+        return dict(await task)
+
+    async def _fetch_parameters(
+        self, key: tuple[str, ...], params: list[str]
+    ) -> dict[str, str]:
+        """Issue a CMD_GET_PARAM request and parse the reply."""
         try:
-            return self.panel.get_device_param(params)
+            response = await self._send_command(
+                CMD_GET_PARAM, ",".join(params).encode()
+            )
+
+            # The panel emits bare KEY=VALUE pairs with no padding. Split
+            # and partition the raw bytes and decode only the final key and
+            # value; latin-1 is a straight byte-to-codepoint mapping, so it
+            # never scans for multi-byte sequences and cannot fail.
+            result = {}
+            for pair in response.split(b","):
+                pair_key, sep, value = pair.partition(b"=")
+                if sep:
+                    result[pair_key.decode("latin-1")] = value.decode("latin-1")
+
+            self._param_cache[key] = (time.monotonic() + PARAM_CACHE_TTL, result)
+            return result
         except Exception as e:
             _LOGGER.error("Error getting parameters: %s", e)
             return {}
 
-    def get_door_status(self) -> list[dict[str, Any]]:
-        """Get status of all doors."""
-        doors = []
-        for door_num in range(1, 5):
-            doors.append({
-                "door": door_num,
+    def _door_state(self, door: int) -> dict[str, Any]:
+        """Return the tracked state record for a door, creating it if new."""
+        state = self._door_states.get(door)
+        if state is None:
+            state = {
+                "door": door,
                 "locked": True,
                 "sensor_open": False,
                 "alarm": False,
-            })
-        return doors
+            }
+            self._door_states[door] = state
+        return state
+
+    def _apply_event(self, event: dict[str, Any]) -> None:
+        """Fold a real-time log event into the tracked door states."""
+        door = event.get("door")
+        if not door:
+            return
 
-    def get_events(self) -> list[dict[str, Any]]:
+        state = self._door_state(door)
+        event_type = event.get("event_type")
+        if event_type == 0:  # normal open
+            state["locked"] = False
+        elif event_type == 1:  # normal close
+            state["locked"] = True
+        elif event_type == 2:  # alarm open
+            state["alarm"] = True
+        elif event_type == 3:  # alarm close
+            state["alarm"] = False
+        elif event_type == 4:  # door opened
+            state["sensor_open"] = True
+        elif event_type == 5:  # door closed
+            state["sensor_open"] = False
+
+    async def get_door_status(self) -> list[dict[str, Any]]:
+        """Get status of all doors.
+
+        Door state is tracked from the real-time log and from control
+        commands, so this returns a snapshot without an extra panel RPC.
+        """
+        info = await self.get_device_info()
+        door_count = info.get("door_count", 4)
+        return [dict(self._door_state(door)) for door in range(1, door_count + 1)]
+
+    async def get_events(self) -> list[dict[str, Any]]:
         """Get real-time events from the panel."""
-        if not self.connected or not self.panel:
+        if not self.connected:
             return []
-        
+
         try:
-            rt_log = self.panel.get_rt_log()
-            
-            events = []
-            for record in rt_log:
-                events.append({
-                    "time": getattr(record, 'time', None),
-                    "pin": getattr(record, 'pin', None),
-                    "door": getattr(record, 'door', None),
-                    "event_type": getattr(record, 'event_type', None),
-                })
-            
+            response = await self._send_command(CMD_RTLOG)
+
+            # Trim any trailing partial record so iter_unpack can walk the
+            # buffer without per-record slicing.
+            usable = len(response) - len(response) % RTLOG_RECORD_SIZE
+            records = _RTLOG_RECORD.iter_unpack(memoryview(response)[:usable])
+
+            events = [
+                {
+                    "time": time_raw,
+                    "pin": pin,
+                    "card": card,
+                    "door": door,
+                    "event_type": event_type,
+                    "in_out": in_out,
+                    "verify": verify,
+                }
+                for time_raw, pin, card, door, event_type, in_out, verify in records
+            ]
+
+            for event in events:
+                self._apply_event(event)
+
             return events
         except Exception as e:
             _LOGGER.debug("No new events: %s", e)
             return []
 
-    def unlock_door(self, door_number: int, duration: int = 5) -> bool:
+    async def unlock_door(self, door_number: int, duration: int = 5) -> bool:
         """Unlock a door for specified duration."""
         if not self.connected:
             _LOGGER.error("Cannot unlock door - not connected")
             return False
-            
-        if not self.panel:
-            _LOGGER.error("Panel object is None")
-            return False
-            
-        if ControlDeviceOutput is None:
-            _LOGGER.error("ControlDeviceOutput library not available")
-            return False
-        
+
         try:
             _LOGGER.info("Unlocking door %s for %s seconds", door_number, duration)
-            control_cmd = ControlDeviceOutput(door_number, 1, duration)
-            
-            try:
-                self.panel.control_device(control_cmd)
-                _LOGGER.info("Door %s unlocked successfully", door_number)
-                return True
-            except Exception as cmd_error:
-                error_msg = str(cmd_error)
-                
-                response_errors = [
-                    "Invalid response header",
-                    "expected",
-                    "received b''",
-                    "does not start with start token",
-                    "Received reply does not start",
-                    "ValueError",
-                ]
-                
-                if any(err in error_msg for err in response_errors):
-                    _LOGGER.debug("Panel response error (command sent successfully): %s", error_msg)
-                    return True
-                else:
-                    raise
-        
+            # operation 1 = output control, address 1 = door output
+            data = _CONTROL.pack(1, door_number, 1, duration, 0)
+
+            await self._send_command(CMD_CONTROL, data)
+            self._door_state(door_number)["locked"] = duration == 0
+            _LOGGER.info("Door %s unlocked successfully", door_number)
+            return True
+
         except Exception as e:
             _LOGGER.error("Failed to unlock door %s: %s", door_number, e)
             return False
 
-    def lock_door(self, door_number: int) -> bool:
+    async def lock_door(self, door_number: int) -> bool:
         """Lock a door immediately."""
-        return self.unlock_door(door_number, 0)
+        return await self.unlock_door(door_number, 0)
+
+    async def control_doors(self, commands: list[tuple[int, int]]) -> bool:
+        """Send several (door_number, duration) control commands pipelined.
+
+        All command packets are written back to back before the replies are
+        read, so N doors cost one round trip instead of N. A duration of 0
+        locks the door.
+        """
+        if not self.connected:
+            _LOGGER.error("Cannot control doors - not connected")
+            return False
+
+        if not self._writer or not self._reader:
+            raise ConnectionError("Not connected to panel")
+
+        try:
+            async with self._lock:
+                packets = []
+                message_numbers = []
+                for door_number, duration in commands:
+                    self._message_number += 1
+                    message_numbers.append(self._message_number)
+                    packets.append(
+                        self._build_packet(
+                            CMD_CONTROL, _CONTROL.pack(1, door_number, 1, duration, 0)
+                        )
+                    )
+
+                self._writer.write(b"".join(packets))
+                responses = []
+                try:
+                    await asyncio.wait_for(
+                        self._writer.drain(), timeout=DEFAULT_TIMEOUT
+                    )
+                    for _ in commands:
+                        responses.append(await self._read_response())
+                except asyncio.CancelledError:
+                    # Cancelled with replies still in flight; drop the
+                    # connection so they cannot be read as later answers.
+                    await self._close()
+                    raise
+                except (asyncio.IncompleteReadError, ConnectionError, OSError):
+                    await self._close()
+                    raise ConnectionError("Connection to panel lost")
+
+            # Raise (and skip the tracked-state updates below) if the panel
+            # refused any command in the batch
+            for response, message_number in zip(responses, message_numbers):
+                self._validate_reply(response, message_number)
+
+            for door_number, duration in commands:
+                self._door_state(door_number)["locked"] = duration == 0
+
+            return True
+
+        except Exception as e:
+            _LOGGER.error("Failed to control doors %s: %s", commands, e)
+            return False
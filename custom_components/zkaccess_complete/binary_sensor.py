@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -25,12 +24,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ZKAccess binary sensor entities."""
-    coordinator: ZKAccessCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: ZKAccessCoordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
     
     entities = []
     
     # Add door sensor for each door
-    for door_num in range(1, coordinator.door_count + 1):
+    for door_num in coordinator.door_numbers:
         entities.append(ZKAccessDoorSensor(coordinator, entry, door_num))
     
     async_add_entities(entities)
@@ -54,11 +53,12 @@ class ZKAccessDoorSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_name = f"{coordinator.panel_name} Door {door_number} Sensor"
         self._attr_unique_id = f"{entry.entry_id}_door_{door_number}_sensor"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": coordinator.panel_name,
-            "manufacturer": "ZKTeco",
-            "model": coordinator.model,
+        self._attr_device_info = coordinator.device_info
+
+        # These never change, so build them once instead of per state write
+        self._attr_extra_state_attributes = {
+            "door_number": door_number,
+            "panel": coordinator.panel_name,
         }
 
     @property
@@ -66,19 +66,11 @@ class ZKAccessDoorSensor(CoordinatorEntity, BinarySensorEntity):
         """Return true if door is open."""
         if not self.coordinator.data:
             return False
-        
-        doors = self.coordinator.data.get("doors", [])
-        
-        for door in doors:
-            if door.get("door") == self._door_number:
-                return door.get("sensor_open", False)
-        
-        return False
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes."""
-        return {
-            "door_number": self._door_number,
-            "panel": self.coordinator.panel_name,
-        }
+        door = self.coordinator.data.get("doors_by_number", {}).get(
+            self._door_number
+        )
+        if door is None:
+            return False
+
+        return door.get("sensor_open", False)
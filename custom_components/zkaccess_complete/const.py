@@ -28,6 +28,14 @@ EVENT_TYPE_CARD_PIN = 202
 EVENT_TYPE_ACCESS_DENIED = 205
 EVENT_TYPE_DURESS = 206
 
+# Event types that trigger a persistent notification
+NOTIFICATION_EVENT_TYPES = frozenset({
+    EVENT_TYPE_ALARM_OPEN,
+    EVENT_TYPE_ALARM_CLOSE,
+    EVENT_TYPE_ACCESS_DENIED,
+    EVENT_TYPE_DURESS,
+})
+
 EVENT_TYPES = {
     0: "Normal Open",
     1: "Normal Close",
@@ -1,9 +1,11 @@
 """Data update coordinator for ZKAccess."""
 from __future__ import annotations
 
+import asyncio
+from collections import deque
 from datetime import timedelta
 import logging
-from typing import Any
+from typing import Any, Protocol, runtime_checkable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PORT
@@ -17,11 +19,28 @@ from .const import (
     DOMAIN,
     CONF_PASSWORD,
     DEFAULT_PORT,
+    DEFAULT_UNLOCK_DURATION,
+    EVENT_TYPES,
+    NOTIFICATION_EVENT_TYPES,
 )
 from .api.c3_client import C3Client
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on one full poll of a panel
+UPDATE_TIMEOUT = 15
+
+
+@runtime_checkable
+class UserSyncCoordinator(Protocol):
+    """Coordinators that can push user records to their panel."""
+
+    async def sync_user(self, user_data: dict[str, Any]) -> None:
+        """Write a user record to the panel."""
+
+    async def delete_user(self, user_id: int) -> None:
+        """Remove a user record from the panel."""
+
 
 class ZKAccessCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ZKAccess data."""
@@ -38,36 +57,61 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
         self.panel_name = entry.data.get("panel_name", "Access Panel")
         self.serial_number = None
         self.door_count = 4
+        self.door_numbers: tuple[int, ...] = tuple(range(1, self.door_count + 1))
         self.model = "C3-400"
         self.connected = False
+
+        # Shared by every entity of this panel; filled in once connected
+        self.device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": self.panel_name,
+            "manufacturer": "ZKTeco",
+            "model": self.model,
+        }
         
-        self.event_buffer = []
         self.max_events = 1000
+        self.event_buffer: deque[dict[str, Any]] = deque(maxlen=self.max_events)
         
         scan_interval = entry.options.get("scan_interval", 5)
 
+        # Read once here; the entry's update listener calls apply_options
+        # when the options flow changes them
+        self.unlock_duration = entry.options.get(
+            "unlock_duration", DEFAULT_UNLOCK_DURATION
+        )
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
             update_interval=timedelta(seconds=scan_interval),
+            always_update=False,
+        )
+
+    def apply_options(self, entry: ConfigEntry) -> None:
+        """Re-read cached options after an options-flow update."""
+        self.unlock_duration = entry.options.get(
+            "unlock_duration", DEFAULT_UNLOCK_DURATION
+        )
+        self.update_interval = timedelta(
+            seconds=entry.options.get("scan_interval", 5)
         )
 
     async def async_connect(self) -> bool:
         """Connect to the panel."""
         try:
-            connected = await self.hass.async_add_executor_job(
-                self.client.connect
-            )
-            
+            connected = await self.client.connect()
+
             if connected:
                 self.connected = True
-                info = await self.hass.async_add_executor_job(
-                    self.client.get_device_info
-                )
+                info = await self.client.get_device_info()
                 self.serial_number = info.get("serial_number", "Unknown")
                 self.door_count = info.get("door_count", 4)
+                self.door_numbers = tuple(range(1, self.door_count + 1))
                 self.model = info.get("model", "C3-400")
+                self.device_info.update(
+                    model=self.model, sw_version=self.serial_number
+                )
                 
                 _LOGGER.info(
                     "Connected to %s at %s - %s doors",
@@ -87,7 +131,7 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
     async def async_disconnect(self) -> None:
         """Disconnect from the panel."""
         try:
-            await self.hass.async_add_executor_job(self.client.disconnect)
+            await self.client.disconnect()
             self.connected = False
             _LOGGER.info("Disconnected from %s", self.panel_name)
         except Exception as err:
@@ -95,29 +139,37 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from panel."""
-        if not self.connected:
-            raise UpdateFailed(f"Not connected to panel {self.panel_name}")
-        
+        if not self.client.connected:
+            # The session dropped or never came up; re-establish it before
+            # polling. The client's circuit breaker keeps this cheap while
+            # the panel stays unreachable.
+            self.connected = False
+            if not await self.async_connect():
+                raise UpdateFailed(f"Not connected to panel {self.panel_name}")
+
         try:
-            doors = await self.hass.async_add_executor_job(
-                self.client.get_door_status
-            )
-            
-            events = await self.hass.async_add_executor_job(
-                self.client.get_events
-            )
+            # Cap the whole poll so a stalled panel cannot hold the refresh
+            # (and everything queued behind it) for longer than one cycle.
+            async with asyncio.timeout(UPDATE_TIMEOUT):
+                doors, events = await asyncio.gather(
+                    self.client.get_door_status(),
+                    self.client.get_events(),
+                )
             
             if events:
+                # deque(maxlen=...) discards the oldest entries itself
                 self.event_buffer.extend(events)
-                if len(self.event_buffer) > self.max_events:
-                    self.event_buffer = self.event_buffer[-self.max_events:]
-                
-                await self._process_events(events)
+
+                if self.entry.options.get("enable_notifications", True):
+                    await self._process_events(events)
             
             return {
                 "doors": doors,
+                "doors_by_number": {door["door"]: door for door in doors},
                 "events": events,
-                "connected": True,
+                # Report the live session state, not the poll's success: a
+                # connection that died mid-poll shows up here immediately
+                "connected": self.client.connected,
             }
 
         except Exception as err:
@@ -126,18 +178,13 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
 
     async def _process_events(self, events: list[dict]) -> None:
         """Process events and send notifications."""
-        if not self.entry.options.get("enable_notifications", True):
-            return
-        
         for event in events:
-            event_type = event.get("event_type")
-            
-            if event_type in [205, 206, 2, 3]:
+            if event.get("event_type") in NOTIFICATION_EVENT_TYPES:
                 await self._send_notification(event)
 
     async def _send_notification(self, event: dict) -> None:
         """Send HA notification for event."""
-        event_type_name = event.get("event_type_name", "Unknown Event")
+        event_type_name = EVENT_TYPES.get(event.get("event_type"), "Unknown Event")
         door_name = event.get("door_name", f"Door {event.get('door')}")
         user_name = event.get("user_name", "Unknown")
         
@@ -154,16 +201,35 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
             },
         )
 
+    def _apply_optimistic_state(self, commands: list[tuple[int, int]]) -> None:
+        """Push the expected door state immediately so entities react now.
+
+        The next poll reconciles against what the panel actually reports.
+        """
+        if not self.data:
+            return
+
+        doors_by_number = self.data.get("doors_by_number")
+        if not doors_by_number:
+            return
+
+        for door_number, duration in commands:
+            door = doors_by_number.get(door_number)
+            if door is not None:
+                door["locked"] = duration == 0
+
+        self.async_set_updated_data(self.data)
+
     async def unlock_door(self, door_number: int, duration: int = 5) -> bool:
         """Unlock a specific door."""
         if not self.connected:
             _LOGGER.error("Cannot unlock door - not connected to panel")
             return False
-        
+
         try:
-            result = await self.hass.async_add_executor_job(
-                self.client.unlock_door, door_number, duration
-            )
+            result = await self.client.unlock_door(door_number, duration)
+            if result:
+                self._apply_optimistic_state([(door_number, duration)])
             await self.async_request_refresh()
             return result
         except Exception as err:
@@ -175,13 +241,42 @@ class ZKAccessCoordinator(DataUpdateCoordinator):
         if not self.connected:
             _LOGGER.error("Cannot lock door - not connected to panel")
             return False
-        
+
         try:
-            result = await self.hass.async_add_executor_job(
-                self.client.lock_door, door_number
-            )
+            result = await self.client.lock_door(door_number)
+            if result:
+                self._apply_optimistic_state([(door_number, 0)])
             await self.async_request_refresh()
             return result
         except Exception as err:
             _LOGGER.error("Failed to lock door %s: %s", door_number, err)
             return False
+
+    async def unlock_doors(self, door_numbers: list[int], duration: int = 5) -> bool:
+        """Unlock several doors in one pipelined panel exchange."""
+        return await self._control_doors(
+            [(door, duration) for door in door_numbers]
+        )
+
+    async def lock_doors(self, door_numbers: list[int]) -> bool:
+        """Lock several doors in one pipelined panel exchange."""
+        return await self._control_doors([(door, 0) for door in door_numbers])
+
+    async def _control_doors(self, commands: list[tuple[int, int]]) -> bool:
+        """Send a batch of door control commands to the panel."""
+        if not commands:
+            return True
+
+        if not self.connected:
+            _LOGGER.error("Cannot control doors - not connected to panel")
+            return False
+
+        try:
+            result = await self.client.control_doors(commands)
+            if result:
+                self._apply_optimistic_state(commands)
+            await self.async_request_refresh()
+            return result
+        except Exception as err:
+            _LOGGER.error("Failed to control doors on %s: %s", self.panel_name, err)
+            return False
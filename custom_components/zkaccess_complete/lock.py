@@ -22,11 +22,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ZKAccess lock entities."""
-    coordinator: ZKAccessCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: ZKAccessCoordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
     
     # Create a lock entity for each door
     entities = []
-    for door_num in range(1, coordinator.door_count + 1):
+    for door_num in coordinator.door_numbers:
         entities.append(ZKAccessDoorLock(coordinator, entry, door_num))
     
     async_add_entities(entities)
@@ -51,13 +51,14 @@ class ZKAccessDoorLock(CoordinatorEntity, LockEntity):
         self._attr_unique_id = f"{entry.entry_id}_door_{door_number}"
         self._attr_has_entity_name = True
         
-        # Device info
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": coordinator.panel_name,
-            "manufacturer": "ZKTeco",
-            "model": coordinator.model,
-            "sw_version": coordinator.serial_number,
+        # Device info shared with the panel's other entities
+        self._attr_device_info = coordinator.device_info
+
+        # These never change, so build them once instead of per state write
+        self._attr_extra_state_attributes = {
+            "door_number": door_number,
+            "panel": coordinator.panel_name,
+            "panel_ip": coordinator.client.ip,
         }
 
     @property
@@ -65,39 +66,28 @@ class ZKAccessDoorLock(CoordinatorEntity, LockEntity):
         """Return true if lock is locked."""
         if not self.coordinator.data:
             return True
-        
-        doors = self.coordinator.data.get("doors", [])
-        
-        for door in doors:
-            if door.get("door") == self._door_number:
-                return door.get("locked", True)
-        
-        return True
+
+        door = self.coordinator.data.get("doors_by_number", {}).get(
+            self._door_number
+        )
+        if door is None:
+            return True
+
+        return door.get("locked", True)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
         return self.coordinator.connected and self.coordinator.last_update_success
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        return {
-            "door_number": self._door_number,
-            "panel": self.coordinator.panel_name,
-            "panel_ip": self.coordinator.client.ip,
-        }
-
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock the door."""
         await self.coordinator.lock_door(self._door_number)
 
     async def async_unlock(self, **kwargs: Any) -> None:
         """Unlock the door."""
-        _LOGGER.error("🔵 Lock entity async_unlock called for door %s", self._door_number)
-    
-        duration = self.coordinator.entry.options.get("unlock_duration", 5)
-        _LOGGER.error("🔵 Calling coordinator.unlock_door with duration=%s", duration)
-    
+        duration = self.coordinator.unlock_duration
         result = await self.coordinator.unlock_door(self._door_number, duration)
-        _LOGGER.error("🔵 Coordinator returned: %s", result)
+        _LOGGER.debug(
+            "Unlock door %s for %ss returned %s", self._door_number, duration, result
+        )
@@ -1,9 +1,11 @@
 """Sensor platform for ZKAccess."""
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -15,75 +17,67 @@ from .coordinator import ZKAccessCoordinator
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class ZKAccessSensorDescription(SensorEntityDescription):
+    """Describes a ZKAccess sensor."""
+
+    value_fn: Callable[[ZKAccessCoordinator], int | str]
+
+
+SENSOR_DESCRIPTIONS: tuple[ZKAccessSensorDescription, ...] = (
+    ZKAccessSensorDescription(
+        key="event_count",
+        name="Event Count",
+        icon="mdi:counter",
+        value_fn=lambda coordinator: len(coordinator.event_buffer),
+    ),
+    ZKAccessSensorDescription(
+        key="status",
+        name="Status",
+        icon="mdi:check-network",
+        value_fn=lambda coordinator: (
+            "Online"
+            if coordinator.data and coordinator.data.get("connected")
+            else "Offline"
+        ),
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ZKAccess sensor entities."""
-    coordinator: ZKAccessCoordinator = hass.data[DOMAIN][entry.entry_id]
-    
-    entities = [
-        ZKAccessEventCountSensor(coordinator, entry),
-        ZKAccessStatusSensor(coordinator, entry),
-    ]
-    
-    async_add_entities(entities)
-
+    coordinator: ZKAccessCoordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
 
-class ZKAccessEventCountSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing event count."""
-
-    def __init__(
-        self,
-        coordinator: ZKAccessCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        
-        self._attr_name = f"{coordinator.panel_name} Event Count"
-        self._attr_unique_id = f"{entry.entry_id}_event_count"
-        self._attr_icon = "mdi:counter"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": coordinator.panel_name,
-            "manufacturer": "ZKTeco",
-            "model": coordinator.model,
-        }
+    async_add_entities(
+        ZKAccessSensor(coordinator, entry, description)
+        for description in SENSOR_DESCRIPTIONS
+    )
 
-    @property
-    def native_value(self) -> int:
-        """Return the event count."""
-        return len(self.coordinator.event_buffer)
 
+class ZKAccessSensor(CoordinatorEntity, SensorEntity):
+    """Sensor backed by a panel coordinator and a descriptor."""
 
-class ZKAccessStatusSensor(CoordinatorEntity, SensorEntity):
-    """Sensor showing panel status."""
+    entity_description: ZKAccessSensorDescription
 
     def __init__(
         self,
         coordinator: ZKAccessCoordinator,
         entry: ConfigEntry,
+        description: ZKAccessSensorDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        
-        self._attr_name = f"{coordinator.panel_name} Status"
-        self._attr_unique_id = f"{entry.entry_id}_status"
-        self._attr_icon = "mdi:check-network"
-        
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": coordinator.panel_name,
-            "manufacturer": "ZKTeco",
-            "model": coordinator.model,
-        }
+
+        self.entity_description = description
+        self._attr_name = f"{coordinator.panel_name} {description.name}"
+        self._attr_unique_id = f"{entry.entry_id}_{description.key}"
+        self._attr_device_info = coordinator.device_info
 
     @property
-    def native_value(self) -> str:
-        """Return the status."""
-        if self.coordinator.data and self.coordinator.data.get("connected"):
-            return "Online"
-        return "Offline"
+    def native_value(self) -> int | str:
+        """Return the sensor value from the descriptor."""
+        return self.entity_description.value_fn(self.coordinator)
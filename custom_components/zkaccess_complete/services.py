@@ -1,6 +1,7 @@
 """Services for ZKAccess Complete Control System."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -24,6 +25,7 @@ from .const import (
     ATTR_START_DATE,
     ATTR_END_DATE,
 )
+from .coordinator import UserSyncCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,37 +71,48 @@ SERVICE_UNLOCK_ALL_SCHEMA = vol.Schema({
 
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for ZKAccess."""
-    
+
+    if hass.services.has_service(DOMAIN, SERVICE_ADD_USER):
+        # Already registered - guard against repeated setup calls
+        return
+
+
     async def handle_add_user(call: ServiceCall) -> None:
         """Handle add user service call."""
-        _LOGGER.info("Adding user: %s", call.data.get(ATTR_USER_NAME))
-        
+        data = call.data
+        _LOGGER.info("Adding user: %s", data.get(ATTR_USER_NAME))
+
         # Get storage helper
         store = hass.data[DOMAIN].get("store")
         if not store:
             _LOGGER.error("Storage not initialized")
             return
-        
-        # Create user record
+
+        # Create user record; the schema has already validated the call,
+        # so pull every field from one local view of the data
         user_data = {
-            "name": call.data.get(ATTR_USER_NAME),
-            "card_number": call.data.get(ATTR_CARD_NUMBER),
-            "pin_code": call.data.get(ATTR_PIN_CODE),
-            "verify_mode": call.data.get(ATTR_VERIFY_MODE),
-            "groups": call.data.get(ATTR_GROUPS, []),
-            "start_date": call.data.get(ATTR_START_DATE),
-            "end_date": call.data.get(ATTR_END_DATE),
+            "name": data.get(ATTR_USER_NAME),
+            "card_number": data.get(ATTR_CARD_NUMBER),
+            "pin_code": data.get(ATTR_PIN_CODE),
+            "verify_mode": data.get(ATTR_VERIFY_MODE),
+            "groups": data.get(ATTR_GROUPS, []),
+            "start_date": data.get(ATTR_START_DATE),
+            "end_date": data.get(ATTR_END_DATE),
             "status": "active",
         }
         
         # Save to storage
         await store.add_user(user_data)
-        
-        # Sync to all panels
-        for coordinator in hass.data[DOMAIN].values():
-            if hasattr(coordinator, "sync_user"):
-                await coordinator.sync_user(user_data)
-        
+
+        # Sync to all panels concurrently
+        tasks = [
+            coordinator.sync_user(user_data)
+            for coordinator in hass.data[DOMAIN]["coordinators"].values()
+            if isinstance(coordinator, UserSyncCoordinator)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
+
         _LOGGER.info("User added successfully")
 
     async def handle_update_user(call: ServiceCall) -> None:
@@ -115,12 +128,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         # Update user record
         user_data = {k: v for k, v in call.data.items() if k != "user_id"}
         await store.update_user(user_id, user_data)
-        
-        # Sync to all panels
-        for coordinator in hass.data[DOMAIN].values():
-            if hasattr(coordinator, "sync_user"):
-                await coordinator.sync_user(user_data)
-        
+
+        # Sync to all panels concurrently
+        tasks = [
+            coordinator.sync_user(user_data)
+            for coordinator in hass.data[DOMAIN]["coordinators"].values()
+            if isinstance(coordinator, UserSyncCoordinator)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
+
         _LOGGER.info("User updated successfully")
 
     async def handle_delete_user(call: ServiceCall) -> None:
@@ -135,12 +152,16 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         
         # Delete from storage
         await store.delete_user(user_id)
-        
-        # Remove from all panels
-        for coordinator in hass.data[DOMAIN].values():
-            if hasattr(coordinator, "delete_user"):
-                await coordinator.delete_user(user_id)
-        
+
+        # Remove from all panels concurrently
+        tasks = [
+            coordinator.delete_user(user_id)
+            for coordinator in hass.data[DOMAIN]["coordinators"].values()
+            if isinstance(coordinator, UserSyncCoordinator)
+        ]
+        if tasks:
+            await asyncio.gather(*tasks)
+
         _LOGGER.info("User deleted successfully")
 
     async def handle_lock_all_doors(call: ServiceCall) -> None:
@@ -148,14 +169,19 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         except_doors = call.data.get("except_doors", [])
         _LOGGER.info("Locking all doors except: %s", except_doors)
         
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if not hasattr(coordinator, "lock_door"):
-                continue
-            
-            for door_num in range(1, coordinator.door_count + 1):
-                if door_num not in except_doors:
-                    await coordinator.lock_door(door_num)
-        
+        tasks = []
+        for entry_id, coordinator in hass.data[DOMAIN]["coordinators"].items():
+            doors = [
+                door_num
+                for door_num in coordinator.door_numbers
+                if door_num not in except_doors
+            ]
+            if doors:
+                tasks.append(coordinator.lock_doors(doors))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
         _LOGGER.info("All doors locked")
 
     async def handle_unlock_all_doors(call: ServiceCall) -> None:
@@ -165,50 +191,31 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         
         _LOGGER.info("Unlocking doors: %s", only_doors if only_doors else "all")
         
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            if not hasattr(coordinator, "unlock_door"):
-                continue
-            
-            for door_num in range(1, coordinator.door_count + 1):
-                if not only_doors or door_num in only_doors:
-                    await coordinator.unlock_door(door_num, duration)
-        
+        tasks = []
+        for entry_id, coordinator in hass.data[DOMAIN]["coordinators"].items():
+            doors = [
+                door_num
+                for door_num in coordinator.door_numbers
+                if not only_doors or door_num in only_doors
+            ]
+            if doors:
+                tasks.append(coordinator.unlock_doors(doors, duration))
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
         _LOGGER.info("Doors unlocked")
 
-    # Register services
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_ADD_USER,
-        handle_add_user,
-        schema=SERVICE_ADD_USER_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UPDATE_USER,
-        handle_update_user,
-        schema=SERVICE_UPDATE_USER_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_DELETE_USER,
-        handle_delete_user,
-        schema=SERVICE_DELETE_USER_SCHEMA,
-    )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_LOCK_ALL_DOORS,
-        handle_lock_all_doors,
-        schema=SERVICE_LOCK_ALL_SCHEMA,
+    # Register services from one table
+    services = (
+        (SERVICE_ADD_USER, handle_add_user, SERVICE_ADD_USER_SCHEMA),
+        (SERVICE_UPDATE_USER, handle_update_user, SERVICE_UPDATE_USER_SCHEMA),
+        (SERVICE_DELETE_USER, handle_delete_user, SERVICE_DELETE_USER_SCHEMA),
+        (SERVICE_LOCK_ALL_DOORS, handle_lock_all_doors, SERVICE_LOCK_ALL_SCHEMA),
+        (SERVICE_UNLOCK_ALL_DOORS, handle_unlock_all_doors, SERVICE_UNLOCK_ALL_SCHEMA),
     )
-    
-    hass.services.async_register(
-        DOMAIN,
-        SERVICE_UNLOCK_ALL_DOORS,
-        handle_unlock_all_doors,
-        schema=SERVICE_UNLOCK_ALL_SCHEMA,
-    )
-    
+
+    for service, handler, schema in services:
+        hass.services.async_register(DOMAIN, service, handler, schema=schema)
+
     _LOGGER.info("ZKAccess services registered")
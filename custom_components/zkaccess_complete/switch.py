@@ -22,7 +22,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up ZKAccess switch entities."""
-    coordinator: ZKAccessCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: ZKAccessCoordinator = hass.data[DOMAIN]["coordinators"][entry.entry_id]
     
     # Placeholder for auxiliary outputs
     entities = []